@@ -39,11 +39,14 @@ from .const import (
     SIGNAL_SYSTEM_STATE_UPDATED,
     SIGNAL_ZONE_STATE_UPDATED,
 )
-from .coordinator import CleanMeZone
+from .coordinator import CleanMeZone, async_schedule_auto_checks
 from . import dashboard as cleanme_dashboard
 
 LOGGER = logging.getLogger(__name__)
 
+# Zones indexed by name for service lookups, kept alongside hass.data[DOMAIN]
+ZONES_BY_NAME = f"{DOMAIN}_by_name"
+
 # Check if PyYAML is available
 try:
     import yaml
@@ -125,8 +128,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     hass.data[DOMAIN][entry.entry_id] = zone
+    # Like the previous scan, the first zone registered under a name wins
+    hass.data.setdefault(ZONES_BY_NAME, {}).setdefault(zone.name, zone)
 
     await zone.async_setup()
+    async_schedule_auto_checks(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     if not hass.services.has_service(DOMAIN, SERVICE_REQUEST_CHECK):
@@ -135,20 +141,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Generate and log dashboard configuration
     LOGGER.info("CleanMe: Registering dashboard for zone '%s'", entry.title)
     dashboard_state = _get_dashboard_state(hass)
-
-    try:
-        dashboard_config = cleanme_dashboard.generate_dashboard_config(hass)
-        hass.data[DOMAIN]["dashboard_config"] = dashboard_config
-        dashboard_state[ATTR_DASHBOARD_STATUS] = "generated"
-        LOGGER.info("CleanMe: Dashboard generated with %d cards", len(dashboard_config.get("cards", [])))
-
-        # Generate YAML dashboard file
-        await _regenerate_dashboard_yaml(hass)
-    except Exception as e:
-        dashboard_state[ATTR_DASHBOARD_STATUS] = "error"
-        dashboard_state[ATTR_DASHBOARD_LAST_ERROR] = str(e)
-        async_dispatcher_send(hass, SIGNAL_SYSTEM_STATE_UPDATED)
-        LOGGER.error("CleanMe: Failed to generate dashboard: %s", e)
+    await _update_dashboard(hass)
     
     # Register the dashboard as a UI panel if not already registered
     if not hass.data[DOMAIN].get("dashboard_panel_registered"):
@@ -187,8 +180,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a CleanMe entry."""
     zone: CleanMeZone = hass.data[DOMAIN].pop(entry.entry_id, None)
     if zone:
+        zones_by_name = hass.data.get(ZONES_BY_NAME, {})
+        if zones_by_name.get(zone.name) is zone:
+            # Names are not unique; fall back to another zone with the same name
+            replacement = next(
+                (
+                    other
+                    for other in hass.data[DOMAIN].values()
+                    if isinstance(other, CleanMeZone) and other.name == zone.name
+                ),
+                None,
+            )
+            if replacement:
+                zones_by_name[zone.name] = replacement
+            else:
+                del zones_by_name[zone.name]
         await zone.async_unload()
 
+    # Re-aim (or stop) the shared auto-check timer without this zone
+    async_schedule_auto_checks(hass)
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if not hass.data[DOMAIN]:
@@ -219,15 +230,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 LOGGER.error("CleanMe: Failed to remove dashboard panel: %s", e)
     else:
         # Regenerate dashboard when zones change
-        try:
-            dashboard_config = cleanme_dashboard.generate_dashboard_config(hass)
-            hass.data[DOMAIN]["dashboard_config"] = dashboard_config
-            LOGGER.info("CleanMe: Dashboard updated after zone removal")
-
-            # Regenerate dashboard YAML
-            await _regenerate_dashboard_yaml(hass)
-        except Exception as e:
-            LOGGER.error("CleanMe: Failed to update dashboard: %s", e)
+        await _update_dashboard(hass)
 
     async_dispatcher_send(hass, SIGNAL_SYSTEM_STATE_UPDATED)
 
@@ -235,13 +238,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 def _find_zone_by_name(hass: HomeAssistant, zone_name: str) -> CleanMeZone | None:
-    for zone in hass.data.get(DOMAIN, {}).values():
-        if isinstance(zone, CleanMeZone) and hasattr(zone, 'name') and zone.name == zone_name:
-            return zone
-    return None
+    return hass.data.get(ZONES_BY_NAME, {}).get(zone_name)
+
+
+async def _update_dashboard(hass: HomeAssistant) -> None:
+    """Regenerate the dashboard config and YAML file after zones change."""
+    dashboard_state = _get_dashboard_state(hass)
 
+    try:
+        dashboard_config = cleanme_dashboard.generate_dashboard_config(hass)
+        hass.data[DOMAIN]["dashboard_config"] = dashboard_config
+        dashboard_state[ATTR_DASHBOARD_STATUS] = "generated"
+        LOGGER.info("CleanMe: Dashboard generated with %d cards", len(dashboard_config.get("cards", [])))
 
-async def _regenerate_dashboard_yaml(hass: HomeAssistant) -> None:
+        # Generate YAML dashboard file from the same config
+        await _regenerate_dashboard_yaml(hass, dashboard_config)
+    except Exception as e:
+        dashboard_state[ATTR_DASHBOARD_STATUS] = "error"
+        dashboard_state[ATTR_DASHBOARD_LAST_ERROR] = str(e)
+        async_dispatcher_send(hass, SIGNAL_SYSTEM_STATE_UPDATED)
+        LOGGER.error("CleanMe: Failed to generate dashboard: %s", e)
+
+
+async def _regenerate_dashboard_yaml(
+    hass: HomeAssistant, dashboard_config: dict[str, Any] | None = None
+) -> None:
     """Generate/update the YAML dashboard file for CleanMe."""
     dashboard_state = _get_dashboard_state(hass)
 
@@ -254,9 +275,10 @@ async def _regenerate_dashboard_yaml(hass: HomeAssistant) -> None:
         return
 
     try:
-        # Generate dashboard config
-        dashboard_config = cleanme_dashboard.generate_dashboard_config(hass)
-        
+        # Generate dashboard config unless the caller already has it
+        if dashboard_config is None:
+            dashboard_config = cleanme_dashboard.generate_dashboard_config(hass)
+
         # Build full Lovelace view YAML
         yaml_content = {
             "title": dashboard_config["title"],
@@ -310,17 +332,6 @@ async def _regenerate_dashboard_yaml(hass: HomeAssistant) -> None:
                     "CleanMe: Persistent notification component not available; "
                     "skipping dashboard notification"
                 )
-            hass.components.persistent_notification.create(
-                (
-                    "Your CleanMe dashboard has been written to:\n"
-                    f"`{yaml_file}`\n\n"
-                    "To use it, go to **Settings → Dashboards → Add dashboard**, "
-                    "choose **YAML**, and select this file as the source. You can "
-                    "then pin it to the sidebar as \"CleanMe\"."
-                ),
-                title="CleanMe dashboard ready",
-                notification_id="cleanme_dashboard_ready",
-            )
         except Exception as err:
             LOGGER.warning(
                 "CleanMe: Unable to create dashboard notification: %s", err
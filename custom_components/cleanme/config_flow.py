@@ -49,7 +49,7 @@ class CleanMeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # Validate API key
                 api_key = user_input[CONF_API_KEY]
                 session = aiohttp_client.async_get_clientsession(self.hass)
-                client = GeminiClient(api_key)
+                client = GeminiClient(self.hass, api_key)
 
                 LOGGER.info("CleanMe: Validating Gemini API key...")
                 is_valid = await client.validate_api_key(session)
@@ -127,7 +127,7 @@ class CleanMeOptionsFlow(config_entries.OptionsFlow):
                 if api_key != old_api_key:
                     LOGGER.info("CleanMe: API key changed, validating new key...")
                     session = aiohttp_client.async_get_clientsession(self.hass)
-                    client = GeminiClient(api_key)
+                    client = GeminiClient(self.hass, api_key)
 
                     is_valid = await client.validate_api_key(session)
                     if not is_valid:
@@ -51,6 +51,17 @@ PERSONALITY_OPTIONS = {
 GEMINI_MODEL = "gemini-2.0-flash-exp"
 GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
 
+# Upper bound on images per request, keeps the combined answer within output limits
+GEMINI_BATCH_MAX_SIZE = 4
+# Gemini rejects inline requests over 20 MB; cap the base64 image data per
+# request below that, leaving room for prompts and JSON overhead
+GEMINI_BATCH_MAX_BYTES = 14 * 1024 * 1024
+GEMINI_MAX_OUTPUT_TOKENS = 2048
+
+# Camera snapshots are downscaled before upload; the model resizes internally anyway
+IMAGE_MAX_DIMENSION = 1024
+IMAGE_JPEG_QUALITY = 75
+
 # Sensor attributes
 ATTR_TASKS = "tasks"
 ATTR_COMMENT = "comment"
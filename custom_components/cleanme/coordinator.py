@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Callable
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Callable, Tuple
 import logging
 
 from homeassistant.core import HomeAssistant, callback
@@ -12,12 +14,15 @@ from homeassistant.components.camera import async_get_image
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import (
+    DOMAIN,
     CONF_CAMERA_ENTITY,
     CONF_API_KEY,
     CONF_PERSONALITY,
     CONF_PICKINESS,
     CONF_CHECK_FREQUENCY,
     FREQUENCY_TO_RUNS,
+    IMAGE_MAX_DIMENSION,
+    IMAGE_JPEG_QUALITY,
     PERSONALITY_THOROUGH,
     SIGNAL_ZONE_STATE_UPDATED,
 )
@@ -25,13 +30,45 @@ from .gemini_client import GeminiClient, GeminiClientError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Auto-check interval per runs/day, in whole seconds
+_INTERVAL_BY_RUNS: Dict[int, timedelta] = {
+    runs: timedelta(seconds=86400 // runs)
+    for runs in FREQUENCY_TO_RUNS.values()
+    if runs > 0
+}
+
+# Check if Pillow is available
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    _LOGGER.warning("CleanMe: Pillow not available, camera images will be sent at full size")
+
+
+def _downscale(image_bytes: bytes) -> bytes:
+    """Shrink and recompress a snapshot for upload (runs in the executor)."""
+    try:
+        with Image.open(BytesIO(image_bytes)) as im:
+            im.thumbnail((IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION))
+            if im.mode != "RGB":
+                im = im.convert("RGB")
+            buf = BytesIO()
+            im.save(buf, "JPEG", quality=IMAGE_JPEG_QUALITY, optimize=True)
+    except Exception as err:
+        _LOGGER.debug("Could not downscale camera image, sending original: %s", err)
+        return image_bytes
+
+    downscaled = buf.getvalue()
+    return downscaled if len(downscaled) < len(image_bytes) else image_bytes
+
 
 @dataclass
 class CleanMeState:
     """State data for a CleanMe zone."""
     tidy: bool = False
     tasks: List[str] = field(default_factory=list)
-    comment: str | None = None
+    comment: str = ""
     severity: str = "medium"
     last_error: str | None = None
     last_checked: datetime | None = None
@@ -45,6 +82,56 @@ class CleanMeState:
         return not self.tidy and bool(self.tasks)
 
 
+def _make_safe(listener: Callable[[], None]) -> Callable[[], None]:
+    """Wrap a listener so a failing entity cannot break notification of the rest."""
+
+    def _safe_listener() -> None:
+        try:
+            listener()
+        except Exception:
+            _LOGGER.debug("CleanMe listener %s failed", listener, exc_info=True)
+
+    return _safe_listener
+
+
+@callback
+def async_schedule_auto_checks(hass: HomeAssistant) -> None:
+    """(Re)arm the shared auto-check timer for the earliest due zone.
+
+    One point-in-time timer is kept for all zones; with no auto zones
+    there is no timer at all.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    unsub = domain_data.pop("scheduler_unsub", None)
+    if unsub:
+        unsub()
+
+    due_times = [
+        zone.next_due
+        for zone in domain_data.values()
+        if isinstance(zone, CleanMeZone) and zone.next_due is not None
+    ]
+    if not due_times:
+        return
+
+    @callback
+    def _fire(now: datetime) -> None:
+        domain_data.pop("scheduler_unsub", None)
+        due = [
+            zone
+            for zone in list(domain_data.values())
+            if isinstance(zone, CleanMeZone) and zone.async_take_if_due(now)
+        ]
+        if due:
+            # Due zones are checked as one group so their Gemini requests are shared
+            hass.async_create_task(CleanMeZone.async_run_auto_checks(hass, due))
+        async_schedule_auto_checks(hass)
+
+    domain_data["scheduler_unsub"] = event.async_track_point_in_utc_time(
+        hass, _fire, min(due_times)
+    )
+
+
 class CleanMeZone:
     """One tidy zone (room/area)."""
 
@@ -62,12 +149,18 @@ class CleanMeZone:
         self._runs_per_day: int = FREQUENCY_TO_RUNS.get(self._check_frequency, 0)
 
         api_key = data.get(CONF_API_KEY) or ""
-        self._gemini_client = GeminiClient(api_key)
+        self._gemini_client = GeminiClient(hass, api_key)
+        self._prompt = GeminiClient.build_prompt(
+            self._name, self._personality, self._pickiness
+        )
 
         self._state = CleanMeState()
         self._listeners: list[Callable[[], None]] = []
-        self._unsub_timer: Optional[Callable[[], None]] = None
+        self._notify_scheduled = False
+        self._auto_interval: Optional[timedelta] = None
+        self._next_due: Optional[datetime] = None
         self._snooze_until: Optional[datetime] = None
+        self._check_lock = asyncio.Lock()
 
     @property
     def name(self) -> str:
@@ -97,46 +190,132 @@ class CleanMeZone:
     def snooze_until(self) -> Optional[datetime]:
         return self._snooze_until
 
+    @property
+    def api_key(self) -> str:
+        return self._gemini_client.api_key
+
+    @property
+    def next_due(self) -> Optional[datetime]:
+        """Return when the next auto check is due, or None in manual mode."""
+        return self._next_due
+
     async def async_setup(self) -> None:
-        """Set up timers if auto mode is enabled."""
+        """Schedule auto checks if auto mode is enabled."""
         if self._runs_per_day > 0:
             self._setup_auto_timer()
 
     @callback
     def _setup_auto_timer(self) -> None:
-        """Set up periodic checks based on runs/day."""
-        if self._unsub_timer:
-            self._unsub_timer()
+        """Set the auto-check interval and first due time from runs/day.
 
-        interval_hours = 24 / float(self._runs_per_day)
-        interval = timedelta(hours=interval_hours)
+        Due times sit on a grid of whole intervals since the UTC epoch, so
+        zones with the same (or a dividing) frequency fall due at exactly
+        the same moment and are checked in one scheduler callback.
+        """
+        self._auto_interval = _INTERVAL_BY_RUNS[self._runs_per_day]
+        seconds = int(self._auto_interval.total_seconds())
+        slot = int(utcnow().timestamp()) // seconds + 1
+        self._next_due = datetime.fromtimestamp(slot * seconds, tz=timezone.utc)
+
+    @callback
+    def async_take_if_due(self, now: datetime) -> bool:
+        """Return True and advance the schedule if an auto check is due."""
+        if self._next_due is None or now < self._next_due:
+            return False
+
+        # Keep the original cadence even if the timer fired late
+        while self._next_due <= now:
+            self._next_due += self._auto_interval
+        return True
+
+    @staticmethod
+    async def async_run_auto_checks(hass: HomeAssistant, zones: List[CleanMeZone]) -> None:
+        """Run auto checks for zones that fell due together.
+
+        Snapshots are captured concurrently, then zones sharing an API key
+        are analyzed through one GeminiClient.analyze_images() call.
+        """
+        now = utcnow()
 
-        async def _handle(now) -> None:
-            await self.async_request_check(reason="auto")
+        ready: List[CleanMeZone] = []
+        for zone in zones:
+            if zone._check_lock.locked():
+                _LOGGER.debug("Zone %s check already in progress, skipping auto check", zone.name)
+                continue
+            if zone._is_snoozed(now):
+                continue
+            # Free lock, so this does not suspend
+            await zone._check_lock.acquire()
+            ready.append(zone)
 
-        self._unsub_timer = event.async_track_time_interval(
-            self.hass, _handle, interval
-        )
+        try:
+            captures = await asyncio.gather(
+                *(zone._async_capture_image(now) for zone in ready)
+            )
+
+            by_key: Dict[str, List[Tuple[CleanMeZone, bytes, int]]] = {}
+            for zone, capture in zip(ready, captures):
+                if capture is not None:
+                    by_key.setdefault(zone.api_key, []).append((zone, *capture))
+
+            session = aiohttp_client.async_get_clientsession(hass)
+            await asyncio.gather(
+                *(
+                    CleanMeZone._async_analyze_group(session, group, now)
+                    for group in by_key.values()
+                )
+            )
+        finally:
+            for zone in ready:
+                zone._check_lock.release()
+
+    @staticmethod
+    async def _async_analyze_group(
+        session, group: List[Tuple[CleanMeZone, bytes, int]], now: datetime
+    ) -> None:
+        """Analyze captured snapshots of zones that share an API key."""
+        client = group[0][0]._gemini_client
+        try:
+            results = await client.analyze_images(
+                session, [(image_bytes, zone._prompt) for zone, image_bytes, _ in group]
+            )
+        except Exception as err:
+            for zone, _, _ in group:
+                _LOGGER.exception("Unexpected error analyzing %s: %s", zone.name, err)
+                zone._record_error(now, f"Unexpected error: {err}")
+            return
+
+        for (zone, _, captured_size), result in zip(group, results):
+            if isinstance(result, GeminiClientError):
+                _LOGGER.error("Gemini API error for %s: %s", zone.name, result)
+                zone._record_error(now, str(result))
+            else:
+                zone._record_result(now, captured_size, result)
 
     async def async_unload(self) -> None:
         """Clean up on unload."""
-        if self._unsub_timer:
-            self._unsub_timer()
-            self._unsub_timer = None
+        self._next_due = None
         self._listeners.clear()
 
     @callback
     def add_listener(self, listener: Callable[[], None]) -> None:
         """Register an entity listener."""
-        self._listeners.append(listener)
+        self._listeners.append(_make_safe(listener))
 
     @callback
     def _notify_listeners(self) -> None:
-        for listener in list(self._listeners):
-            try:
-                listener()
-            except Exception:
-                continue
+        """Schedule one listener flush for this loop iteration."""
+        if self._notify_scheduled:
+            return
+        self._notify_scheduled = True
+        self.hass.loop.call_soon(self._flush_listeners)
+
+    @callback
+    def _flush_listeners(self) -> None:
+        self._notify_scheduled = False
+        # Listeners are only added/cleared on the event loop, never during a flush
+        for listener in self._listeners:
+            listener()
         async_dispatcher_send(self.hass, SIGNAL_ZONE_STATE_UPDATED)
 
     async def async_snooze(self, minutes: int) -> None:
@@ -153,24 +332,29 @@ class CleanMeZone:
         self._notify_listeners()
 
     async def async_request_check(self, reason: str = "manual") -> None:
-        """Run a check now (may be called by service or timer)."""
+        """Run a check now (may be called by service or timer).
+
+        Overlapping checks are serialized; an auto check is skipped if a
+        check is already running.
+        """
+        if reason == "auto" and self._check_lock.locked():
+            _LOGGER.debug("Zone %s check already in progress, skipping auto check", self._name)
+            return
+
+        async with self._check_lock:
+            await self._async_run_check(reason)
+
+    async def _async_run_check(self, reason: str) -> None:
+        """Capture, analyze and store the result for one check."""
         now = utcnow()
 
-        # Check if zone is snoozed
-        if reason == "auto" and self._snooze_until and now < self._snooze_until:
-            _LOGGER.debug("Zone %s is snoozed until %s", self._name, self._snooze_until)
+        if reason == "auto" and self._is_snoozed(now):
             return
 
-        try:
-            image = await async_get_image(self.hass, self._camera_entity_id)
-            image_bytes = image.content
-        except Exception as err:
-            _LOGGER.error("Failed to capture camera image for %s: %s", self._name, err)
-            self._state.last_error = f"Failed to capture camera image: {err}"
-            self._state.tidy = False
-            self._state.last_checked = now
-            self._notify_listeners()
+        capture = await self._async_capture_image(now)
+        if capture is None:
             return
+        image_bytes, captured_size = capture
 
         session = aiohttp_client.async_get_clientsession(self.hass)
 
@@ -178,31 +362,57 @@ class CleanMeZone:
             result = await self._gemini_client.analyze_image(
                 session=session,
                 image_bytes=image_bytes,
-                room_name=self._name,
-                personality=self._personality,
-                pickiness=self._pickiness,
+                prompt=self._prompt,
             )
         except GeminiClientError as err:
             _LOGGER.error("Gemini API error for %s: %s", self._name, err)
-            self._state.last_error = str(err)
-            self._state.tidy = False
-            self._state.last_checked = now
-            self._notify_listeners()
+            self._record_error(now, str(err))
             return
         except Exception as err:
             _LOGGER.exception("Unexpected error analyzing %s: %s", self._name, err)
-            self._state.last_error = f"Unexpected error: {err}"
-            self._state.tidy = False
-            self._state.last_checked = now
-            self._notify_listeners()
+            self._record_error(now, f"Unexpected error: {err}")
             return
 
-        # Update state with results
+        self._record_result(now, captured_size, result)
+
+    def _is_snoozed(self, now: datetime) -> bool:
+        """Return True if auto checks are snoozed at this time."""
+        if self._snooze_until and now < self._snooze_until:
+            _LOGGER.debug("Zone %s is snoozed until %s", self._name, self._snooze_until)
+            return True
+        return False
+
+    async def _async_capture_image(self, now: datetime) -> Optional[Tuple[bytes, int]]:
+        """Return the (upload bytes, captured size) snapshot, or None on failure."""
+        try:
+            image = await async_get_image(self.hass, self._camera_entity_id)
+            image_bytes = image.content
+            # Report the captured size, not the (possibly downscaled) upload size
+            captured_size = len(image_bytes)
+            if PIL_AVAILABLE:
+                image_bytes = await self.hass.async_add_executor_job(_downscale, image_bytes)
+        except Exception as err:
+            _LOGGER.error("Failed to capture camera image for %s: %s", self._name, err)
+            self._record_error(now, f"Failed to capture camera image: {err}")
+            return None
+        return image_bytes, captured_size
+
+    @callback
+    def _record_error(self, now: datetime, message: str) -> None:
+        """Store a failed check."""
+        self._state.last_error = message
+        self._state.tidy = False
+        self._state.last_checked = now
+        self._notify_listeners()
+
+    @callback
+    def _record_result(self, now: datetime, captured_size: int, result: Dict[str, Any]) -> None:
+        """Store a successful analysis."""
         self._state.tidy = result.get("tidy", False)
         self._state.tasks = result.get("tasks", [])
         self._state.comment = result.get("comment", "")
         self._state.severity = result.get("severity", "medium")
-        self._state.image_size = result.get("image_size", 0)
+        self._state.image_size = captured_size
         self._state.api_response_time = result.get("api_response_time", 0.0)
         self._state.full_analysis = result
         self._state.last_error = None
@@ -3,55 +3,316 @@
 Uses Google's Gemini 2.0 Flash Experimental model for fast, accurate
 vision analysis of room images. Supports configurable personalities and
 pickiness levels for customized tidiness assessments.
+
+Zones checked together (by the shared auto-check scheduler) can be
+analyzed in a single multi-image request.
 """
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
+from dataclasses import dataclass
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import aiohttp
-
-from .const import GEMINI_MODEL, GEMINI_API_BASE
+import orjson
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.ssl import client_context
+
+from .const import (
+    GEMINI_MODEL,
+    GEMINI_API_BASE,
+    GEMINI_BATCH_MAX_SIZE,
+    GEMINI_BATCH_MAX_BYTES,
+    GEMINI_MAX_OUTPUT_TOKENS,
+    PERSONALITY_CHILL,
+    PERSONALITY_THOROUGH,
+    PERSONALITY_STRICT,
+    PERSONALITY_SARCASTIC,
+    PERSONALITY_PROFESSIONAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Built once and shared; requests go through Home Assistant's shared
+# session, whose connector already keeps provider connections alive.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=90)
+_VALIDATE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# Home Assistant's cached client SSL context, so no request loads CA certs again
+_SSL_CONTEXT = client_context()
+
+_PERSONALITY_INSTRUCTIONS: Dict[str, str] = {
+    PERSONALITY_CHILL: "Be relaxed and supportive. Only flag obvious messes. Use a friendly, encouraging tone.",
+    PERSONALITY_THOROUGH: "Be detailed and helpful. Use normal tidiness standards. Provide clear, actionable guidance.",
+    PERSONALITY_STRICT: "Be critical and demanding. Flag every imperfection. Use a firm, no-nonsense tone.",
+    PERSONALITY_SARCASTIC: "Be funny and snarky. Make cleanup entertaining. Use witty observations and playful criticism.",
+    PERSONALITY_PROFESSIONAL: "Be formal and clinical. Use business language. Provide objective, matter-of-fact assessments.",
+}
+
+_PICKINESS_INSTRUCTIONS: Dict[int, str] = {
+    1: "Level 1 Pickiness: Only report major messes, health hazards, or obvious clutter that significantly impacts the space.",
+    2: "Level 2 Pickiness: Report significant items but ignore minor things. Focus on visible problems that should be addressed soon.",
+    3: "Level 3 Pickiness: Report normal everyday tidiness issues. Use standard home cleanliness expectations.",
+    4: "Level 4 Pickiness: Be thorough and report most issues. Notice things that might be overlooked in a casual inspection.",
+    5: "Level 5 Pickiness: Be extremely thorough. Report any imperfections, dust, items slightly out of place, or anything less than perfect.",
+}
+
+_VALID_SEVERITIES = frozenset({"low", "medium", "high"})
+
+_RESPONSE_RULES = """Focus on: clutter, dishes, trash, surfaces needing cleaning, items out of place.
+Be practical and realistic.
+Do not include any markdown formatting, just raw JSON."""
+
+_SINGLE_RESPONSE_FORMAT = f"""Respond ONLY with valid JSON in this exact format:
+{{
+  "tidy": true/false,
+  "tasks": ["task 1", "task 2"],
+  "comment": "your observation",
+  "severity": "low/medium/high"
+}}
+
+{_RESPONSE_RULES}"""
+
+_BATCH_RESPONSE_FORMAT = f"""Respond ONLY with valid JSON in this exact format, with one entry per image number:
+{{
+  "rooms": {{
+    "1": {{
+      "tidy": true/false,
+      "tasks": ["task 1", "task 2"],
+      "comment": "your observation",
+      "severity": "low/medium/high"
+    }}
+  }}
+}}
+
+Judge every image independently, using the instructions given for its room.
+{_RESPONSE_RULES}"""
+
 
 class GeminiClientError(Exception):
     """Raised when the Gemini API client fails."""
 
 
+class _MalformedResponseError(GeminiClientError):
+    """Raised when Gemini answered but the answer could not be used."""
+
+
+@dataclass
+class _Check:
+    """One room image to analyze."""
+
+    prompt: str
+    image_b64: str
+
+
+def _split_batches(checks: List[_Check]) -> List[List[_Check]]:
+    """Group checks into requests bounded by image count and encoded size.
+
+    An image larger than the byte budget on its own is still sent, alone.
+    """
+    batches: List[List[_Check]] = []
+    batch: List[_Check] = []
+    batch_bytes = 0
+
+    for check in checks:
+        size = len(check.image_b64)
+        if batch and (
+            len(batch) >= GEMINI_BATCH_MAX_SIZE
+            or batch_bytes + size > GEMINI_BATCH_MAX_BYTES
+        ):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(check)
+        batch_bytes += size
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _encode_images(images: List[bytes]) -> List[str]:
+    """Return the images as base64 strings (runs in the executor)."""
+    return [base64.b64encode(image).decode("utf-8") for image in images]
+
+
+def _image_part(image_b64: str) -> Dict[str, Any]:
+    """Build an inline JPEG part for a Gemini request."""
+    return {
+        "inline_data": {
+            "mime_type": "image/jpeg",
+            "data": image_b64,
+        }
+    }
+
+
+def _extract_json_text(data: Dict[str, Any]) -> str:
+    """Return the JSON text from the first candidate of a Gemini response."""
+    candidates = data.get("candidates", [])
+    if not candidates:
+        raise ValueError("No candidates in response")
+
+    first = candidates[0]
+    parts = first.get("content", {}).get("parts", [])
+
+    text_block = None
+    for part in parts:
+        if "text" in part:
+            text_block = part["text"]
+            break
+
+    if not text_block:
+        raise ValueError("No text content in response")
+
+    # Extract JSON from response (handle markdown code blocks)
+    text_block = text_block.strip()
+    if text_block.startswith("```json"):
+        text_block = text_block[7:]
+    if text_block.startswith("```"):
+        text_block = text_block[3:]
+    if text_block.endswith("```"):
+        text_block = text_block[:-3]
+
+    return text_block.strip()
+
+
 class GeminiClient:
     """Client for Gemini API with vision capabilities."""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, hass: HomeAssistant, api_key: str) -> None:
         """Initialize Gemini client."""
+        self._hass = hass
         self._api_key = api_key
 
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
     async def analyze_image(
         self,
         session: aiohttp.ClientSession,
         image_bytes: bytes,
-        room_name: str,
-        personality: str,
-        pickiness: int,
+        prompt: str,
     ) -> Dict[str, Any]:
         """
         Analyze room image using Gemini vision model.
 
+        ``prompt`` is the zone's room instructions from build_prompt().
+
         Returns dict with:
         - tidy: bool
         - tasks: list of task strings
         - comment: str
         - severity: str (low/medium/high)
         """
+        result = (await self.analyze_images(session, [(image_bytes, prompt)]))[0]
+        if isinstance(result, GeminiClientError):
+            raise result
+        return result
+
+    async def analyze_images(
+        self,
+        session: aiohttp.ClientSession,
+        images: List[Tuple[bytes, str]],
+    ) -> List[Any]:
+        """Analyze several (image_bytes, prompt) rooms, sharing requests.
+
+        Returns one entry per room, in order: the result dict as returned by
+        analyze_image(), or the GeminiClientError for that room.
+        """
         start_time = time.time()
 
-        image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+        # Encoding multi-megabyte snapshots is CPU bound
+        encoded = await self._hass.async_add_executor_job(
+            _encode_images, [image_bytes for image_bytes, _ in images]
+        )
+        checks = [
+            _Check(prompt, image_b64)
+            for (_, prompt), image_b64 in zip(images, encoded)
+        ]
+
+        answers: List[Any] = []
+        for batch_answers in await asyncio.gather(
+            *(self._async_send(session, batch) for batch in _split_batches(checks))
+        ):
+            answers.extend(batch_answers)
 
-        prompt = self._build_prompt(room_name, personality, pickiness)
+        response_time = time.time() - start_time
+
+        results: List[Any] = []
+        for answer in answers:
+            if isinstance(answer, GeminiClientError):
+                results.append(answer)
+                continue
+            # Validate and normalize response
+            try:
+                result = self._validate_response(answer)
+            except GeminiClientError as err:
+                results.append(err)
+                continue
+            result["api_response_time"] = response_time
+            results.append(result)
+        return results
+
+    async def _async_send(
+        self, session: aiohttp.ClientSession, batch: List[_Check]
+    ) -> List[Any]:
+        """Send one request, returning the parsed answer or error per room."""
+        try:
+            answers = await self._async_request(session, batch)
+        except _MalformedResponseError as err:
+            answers = [err] * len(batch)
+        except GeminiClientError as err:
+            return [err] * len(batch)
+
+        # Rooms a multi-image answer did not cover are retried one at a time,
+        # so one bad answer costs extra requests rather than failed checks
+        if len(batch) > 1:
+            retry = [
+                index
+                for index, answer in enumerate(answers)
+                if isinstance(answer, _MalformedResponseError)
+            ]
+            if retry:
+                _LOGGER.warning(
+                    "Gemini batch answer unusable for %d of %d images, retrying them singly",
+                    len(retry),
+                    len(batch),
+                )
+                singles = await asyncio.gather(
+                    *(self._async_send(session, [batch[index]]) for index in retry)
+                )
+                for index, single in zip(retry, singles):
+                    answers[index] = single[0]
+
+        return answers
+
+    async def _async_request(
+        self, session: aiohttp.ClientSession, batch: List[_Check]
+    ) -> List[Any]:
+        """Post the batch to Gemini and split the answer per room."""
+        if len(batch) == 1:
+            parts: List[Dict[str, Any]] = [
+                {"text": batch[0].prompt},
+                {"text": _SINGLE_RESPONSE_FORMAT},
+                _image_part(batch[0].image_b64),
+            ]
+        else:
+            parts = [
+                {
+                    "text": (
+                        f"You are analyzing {len(batch)} rooms for tidiness. "
+                        "Each room's instructions are followed by its image."
+                    )
+                }
+            ]
+            for index, check in enumerate(batch, start=1):
+                parts.append({"text": f"Image {index}:\n{check.prompt}"})
+                parts.append(_image_part(check.image_b64))
+            parts.append({"text": _BATCH_RESPONSE_FORMAT})
 
         url = f"{GEMINI_API_BASE}/models/{GEMINI_MODEL}:generateContent"
 
@@ -61,85 +322,77 @@ class GeminiClient:
         }
 
         payload = {
-            "contents": [
-                {
-                    "parts": [
-                        {"text": prompt},
-                        {
-                            "inline_data": {
-                                "mime_type": "image/jpeg",
-                                "data": image_b64,
-                            }
-                        },
-                    ]
-                }
-            ],
+            "contents": [{"parts": parts}],
             "generationConfig": {
                 "temperature": 0.4,
                 "topK": 32,
                 "topP": 1,
-                "maxOutputTokens": 2048,
+                "maxOutputTokens": GEMINI_MAX_OUTPUT_TOKENS * len(batch),
             },
         }
 
         try:
-            async with session.post(url, headers=headers, json=payload, timeout=90) as resp:
+            async with session.post(
+                url,
+                headers=headers,
+                data=orjson.dumps(payload),
+                timeout=_REQUEST_TIMEOUT,
+                ssl=_SSL_CONTEXT,
+            ) as resp:
+                # Read the body once; it is decoded only where needed
+                raw = await resp.read()
                 if resp.status != 200:
-                    text = await resp.text()
+                    text = raw.decode("utf-8", errors="replace")
                     raise GeminiClientError(f"Gemini API HTTP {resp.status}: {text}")
-
-                data = await resp.json()
+        except GeminiClientError:
+            raise
         except aiohttp.ClientError as err:
             raise GeminiClientError(f"Network error calling Gemini API: {err}") from err
         except Exception as err:
             raise GeminiClientError(f"Unexpected error calling Gemini API: {err}") from err
 
-        response_time = time.time() - start_time
-
         # Parse Gemini response
         try:
-            candidates = data.get("candidates", [])
-            if not candidates:
-                raise ValueError("No candidates in response")
-
-            first = candidates[0]
-            parts = first.get("content", {}).get("parts", [])
-
-            text_block = None
-            for part in parts:
-                if "text" in part:
-                    text_block = part["text"]
-                    break
-
-            if not text_block:
-                raise ValueError("No text content in response")
-
-            # Extract JSON from response (handle markdown code blocks)
-            text_block = text_block.strip()
-            if text_block.startswith("```json"):
-                text_block = text_block[7:]
-            if text_block.startswith("```"):
-                text_block = text_block[3:]
-            if text_block.endswith("```"):
-                text_block = text_block[:-3]
-
-            parsed = json.loads(text_block.strip())
-
+            data = orjson.loads(raw)
+            text_block = _extract_json_text(data)
+            parsed = orjson.loads(text_block)
         except Exception as err:
-            _LOGGER.error("Failed to parse Gemini response: %s", data)
-            raise GeminiClientError(f"Malformed Gemini response: {err}") from err
+            _LOGGER.error("Failed to parse Gemini response: %s", raw.decode("utf-8", errors="replace"))
+            raise _MalformedResponseError(f"Malformed Gemini response: {err}") from err
+
+        if len(batch) == 1:
+            return [parsed]
+
+        rooms = parsed.get("rooms") if isinstance(parsed, dict) else None
+        if not isinstance(rooms, dict):
+            _LOGGER.error("Gemini batch response has no 'rooms' object: %s", parsed)
+            raise _MalformedResponseError("Malformed Gemini response: missing 'rooms'")
+
+        results: List[Any] = []
+        for index in range(1, len(batch) + 1):
+            room = rooms.get(str(index))
+            if room is None:
+                results.append(
+                    _MalformedResponseError(f"Malformed Gemini response: no result for image {index}")
+                )
+            else:
+                results.append(room)
+        return results
 
-        # Validate and normalize response
-        result = self._validate_response(parsed)
-        result["api_response_time"] = response_time
-        result["image_size"] = len(image_bytes)
-
-        return result
+    @staticmethod
+    def build_prompt(room_name: str, personality: str, pickiness: int) -> str:
+        """Build the room instructions with personality and pickiness.
 
-    def _build_prompt(self, room_name: str, personality: str, pickiness: int) -> str:
-        """Build the analysis prompt with personality and pickiness instructions."""
-        personality_instructions = self._get_personality_instructions(personality)
-        pickiness_instructions = self._get_pickiness_instructions(pickiness)
+        The JSON response format is sent as a separate part so the same
+        instructions work for single and batched requests. The result only
+        depends on zone configuration, so zones build it once.
+        """
+        personality_instructions = _PERSONALITY_INSTRUCTIONS.get(
+            personality, _PERSONALITY_INSTRUCTIONS[PERSONALITY_THOROUGH]
+        )
+        pickiness_instructions = _PICKINESS_INSTRUCTIONS.get(
+            pickiness, _PICKINESS_INSTRUCTIONS[3]
+        )
 
         return f"""You are analyzing a room for tidiness using image analysis.
 
@@ -154,41 +407,7 @@ Pickiness level: {pickiness}/5
 Look at this image carefully and determine:
 1. Is the room tidy and organized?
 2. What specific tasks need doing (if any)?
-3. A brief, {personality}-toned comment
-
-Respond ONLY with valid JSON in this exact format:
-{{
-  "tidy": true/false,
-  "tasks": ["task 1", "task 2"],
-  "comment": "your observation",
-  "severity": "low/medium/high"
-}}
-
-Focus on: clutter, dishes, trash, surfaces needing cleaning, items out of place.
-Be practical and realistic.
-Do not include any markdown formatting, just raw JSON."""
-
-    def _get_personality_instructions(self, personality: str) -> str:
-        """Get personality-specific instructions."""
-        instructions = {
-            "chill": "Be relaxed and supportive. Only flag obvious messes. Use a friendly, encouraging tone.",
-            "thorough": "Be detailed and helpful. Use normal tidiness standards. Provide clear, actionable guidance.",
-            "strict": "Be critical and demanding. Flag every imperfection. Use a firm, no-nonsense tone.",
-            "sarcastic": "Be funny and snarky. Make cleanup entertaining. Use witty observations and playful criticism.",
-            "professional": "Be formal and clinical. Use business language. Provide objective, matter-of-fact assessments.",
-        }
-        return instructions.get(personality, instructions["thorough"])
-
-    def _get_pickiness_instructions(self, pickiness: int) -> str:
-        """Get pickiness level instructions."""
-        instructions = {
-            1: "Level 1 Pickiness: Only report major messes, health hazards, or obvious clutter that significantly impacts the space.",
-            2: "Level 2 Pickiness: Report significant items but ignore minor things. Focus on visible problems that should be addressed soon.",
-            3: "Level 3 Pickiness: Report normal everyday tidiness issues. Use standard home cleanliness expectations.",
-            4: "Level 4 Pickiness: Be thorough and report most issues. Notice things that might be overlooked in a casual inspection.",
-            5: "Level 5 Pickiness: Be extremely thorough. Report any imperfections, dust, items slightly out of place, or anything less than perfect.",
-        }
-        return instructions.get(pickiness, instructions[3])
+3. A brief, {personality}-toned comment"""
 
     @staticmethod
     def _validate_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -207,10 +426,13 @@ Do not include any markdown formatting, just raw JSON."""
             raise GeminiClientError("'tasks' must be a list")
 
         # Clean and validate tasks
-        cleaned_tasks = []
+        cleaned_tasks: List[str] = []
+        append = cleaned_tasks.append
         for task in tasks:
-            if isinstance(task, str) and task.strip():
-                cleaned_tasks.append(task.strip())
+            if isinstance(task, str):
+                task = task.strip()
+                if task:
+                    append(task)
 
         # Validate comment
         comment = data.get("comment", "")
@@ -219,7 +441,7 @@ Do not include any markdown formatting, just raw JSON."""
 
         # Validate severity
         severity = data.get("severity", "medium")
-        if severity not in ("low", "medium", "high"):
+        if severity not in _VALID_SEVERITIES:
             severity = "medium"
 
         return {
@@ -238,7 +460,7 @@ Do not include any markdown formatting, just raw JSON."""
         }
 
         try:
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            async with session.get(url, headers=headers, timeout=_VALIDATE_TIMEOUT, ssl=_SSL_CONTEXT) as resp:
                 return resp.status == 200
         except Exception:
             return False
@@ -77,15 +77,17 @@ class CleanMeTasksSensor(CleanMeBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the number of tasks."""
-        return len(self._zone.state.tasks or [])
+        return len(self._zone.state.tasks)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return task list and other details."""
+        # Tasks are stored already cleaned, so they are exposed as-is
+        state = self._zone.state
         return {
-            ATTR_TASKS: self._zone.state.tasks or [],
-            ATTR_COMMENT: self._zone.state.comment or "",
-            ATTR_FULL_ANALYSIS: self._zone.state.full_analysis or {},
+            ATTR_TASKS: state.tasks,
+            ATTR_COMMENT: state.comment,
+            ATTR_FULL_ANALYSIS: state.full_analysis,
         }
 
 
@@ -188,7 +190,7 @@ class CleanMeSystemStatusSensor(SensorEntity):
         if last_generated:
             last_generated = as_local(last_generated).isoformat()
 
-        task_total = sum(len(zone.state.tasks or []) for zone in zones)
+        task_total = sum(len(zone.state.tasks) for zone in zones)
 
         ready = bool(
             zones
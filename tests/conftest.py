@@ -1,4 +1,8 @@
+import importlib.util
+import ssl
 import sys
+import types
+from datetime import datetime, timezone
 from pathlib import Path
 
 
@@ -6,3 +10,49 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+PACKAGE_DIR = PROJECT_ROOT / "custom_components" / "cleanme"
+
+
+def _stub_homeassistant():
+    """Provide the few Home Assistant names the integration modules import, if HA is absent."""
+    if importlib.util.find_spec("homeassistant") is not None:
+        return
+
+    def module(name, **attrs):
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        return mod
+
+    async def _not_available(*args, **kwargs):
+        raise RuntimeError("not available in tests")
+
+    module("homeassistant")
+    module("homeassistant.core", HomeAssistant=object, callback=lambda func: func)
+    module("homeassistant.util")
+    module("homeassistant.util.ssl", client_context=ssl.create_default_context)
+    module("homeassistant.util.dt", utcnow=lambda: datetime.now(timezone.utc))
+    module(
+        "homeassistant.helpers",
+        aiohttp_client=module(
+            "homeassistant.helpers.aiohttp_client",
+            async_get_clientsession=lambda hass: None,
+        ),
+        event=module(
+            "homeassistant.helpers.event",
+            async_track_point_in_utc_time=lambda hass, action, point: None,
+        ),
+    )
+    module("homeassistant.helpers.dispatcher", async_dispatcher_send=lambda *args: None)
+    module("homeassistant.components")
+    module("homeassistant.components.camera", async_get_image=_not_available)
+
+
+_stub_homeassistant()
+
+# Expose the integration as a bare package so its __init__ (and its HA imports) is skipped;
+# tests import modules as cleanme_under_test.<module>
+_package = types.ModuleType("cleanme_under_test")
+_package.__path__ = [str(PACKAGE_DIR)]
+sys.modules["cleanme_under_test"] = _package
@@ -0,0 +1,127 @@
+import asyncio
+import importlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("orjson")
+
+
+coordinator = importlib.import_module("cleanme_under_test.coordinator")
+const = importlib.import_module("cleanme_under_test.const")
+
+
+class FakeHass:
+    def __init__(self):
+        self.data = {}
+
+    def async_create_task(self, coro):
+        pass
+
+
+class FakeTimers:
+    """Record the shared scheduler's point-in-time timers."""
+
+    def __init__(self):
+        self.armed = []
+
+    def track(self, hass, action, point):
+        entry = (point, action)
+        self.armed.append(entry)
+        return lambda: self.armed.remove(entry)
+
+    def fire_next(self):
+        point, action = self.armed.pop(0)
+        action(point)
+        return point
+
+
+def make_zone(hass, entry_id, frequency=const.FREQUENCY_4X):
+    zone = coordinator.CleanMeZone(
+        hass,
+        entry_id,
+        entry_id,
+        {
+            const.CONF_CAMERA_ENTITY: f"camera.{entry_id}",
+            const.CONF_API_KEY: "key",
+            const.CONF_CHECK_FREQUENCY: frequency,
+        },
+    )
+    hass.data.setdefault(const.DOMAIN, {})[entry_id] = zone
+    return zone
+
+
+@pytest.fixture
+def timers(monkeypatch):
+    timers = FakeTimers()
+    monkeypatch.setattr(coordinator.event, "async_track_point_in_utc_time", timers.track)
+    return timers
+
+
+@pytest.fixture
+def group_runs(monkeypatch):
+    runs = []
+
+    def record(hass, zones):
+        runs.append([zone.name for zone in zones])
+
+    monkeypatch.setattr(coordinator.CleanMeZone, "async_run_auto_checks", staticmethod(record))
+    return runs
+
+
+def set_up_zones(monkeypatch, hass, setups):
+    """Set up zones one after another, at the given (entry_id, frequency, time)."""
+    for entry_id, frequency, now in setups:
+        monkeypatch.setattr(coordinator, "utcnow", lambda now=now: now)
+        zone = make_zone(hass, entry_id, frequency)
+        asyncio.run(zone.async_setup())
+        coordinator.async_schedule_auto_checks(hass)
+
+
+def test_zones_set_up_ms_apart_fire_in_one_callback(monkeypatch, timers, group_runs):
+    hass = FakeHass()
+    start = datetime(2026, 10, 15, 9, 17, 42, 123000, tzinfo=timezone.utc)
+    set_up_zones(
+        monkeypatch,
+        hass,
+        [
+            ("kitchen", const.FREQUENCY_4X, start),
+            ("den", const.FREQUENCY_4X, start + timedelta(milliseconds=3)),
+        ],
+    )
+
+    assert len(timers.armed) == 1
+    point = timers.fire_next()
+
+    assert point == datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+    assert group_runs == [["kitchen", "den"]]
+    zones = [hass.data[const.DOMAIN][entry_id] for entry_id in ("kitchen", "den")]
+    assert [zone.next_due for zone in zones] == [
+        point + timedelta(hours=6),
+        point + timedelta(hours=6),
+    ]
+    # Rearmed once for both zones
+    assert [armed_point for armed_point, _ in timers.armed] == [point + timedelta(hours=6)]
+
+
+def test_less_frequent_zone_joins_the_shared_slot(monkeypatch, timers, group_runs):
+    hass = FakeHass()
+    start = datetime(2026, 10, 15, 9, 17, tzinfo=timezone.utc)
+    set_up_zones(
+        monkeypatch,
+        hass,
+        [
+            ("kitchen", const.FREQUENCY_4X, start),
+            ("den", const.FREQUENCY_2X, start + timedelta(minutes=5)),
+        ],
+    )
+
+    fired = [timers.fire_next() for _ in range(3)]
+
+    assert fired == [
+        datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc),
+        datetime(2026, 10, 15, 18, 0, tzinfo=timezone.utc),
+        datetime(2026, 10, 16, 0, 0, tzinfo=timezone.utc),
+    ]
+    assert group_runs == [["kitchen", "den"], ["kitchen"], ["kitchen", "den"]]
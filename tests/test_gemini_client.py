@@ -0,0 +1,217 @@
+import asyncio
+import base64
+import importlib
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("orjson")
+
+
+gemini_client = importlib.import_module("cleanme_under_test.gemini_client")
+
+
+class FakeHass:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.data = {}
+
+    async def async_add_executor_job(self, func, *args):
+        return await self.loop.run_in_executor(None, func, *args)
+
+    def async_create_task(self, coro):
+        return self.loop.create_task(coro)
+
+
+class FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+def gemini_body(answer):
+    text = json.dumps(answer) if not isinstance(answer, str) else answer
+    return json.dumps(
+        {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    ).encode()
+
+
+def room_answer(comment):
+    return {"tidy": True, "tasks": [], "comment": comment, "severity": "low"}
+
+
+def echo_rooms(images, skip=()):
+    """Answer every image with its own decoded bytes as the comment."""
+    if len(images) == 1:
+        return 200, gemini_body(room_answer(images[0]))
+    rooms = {
+        str(index): room_answer(image)
+        for index, image in enumerate(images, start=1)
+        if index not in skip
+    }
+    return 200, gemini_body({"rooms": rooms})
+
+
+class FakeSession:
+    def __init__(self, responder=echo_rooms):
+        self.responder = responder
+        self.requests = []
+
+    def post(self, url, **kwargs):
+        payload = json.loads(kwargs["data"])
+        images = [
+            base64.b64decode(part["inline_data"]["data"]).decode()
+            for part in payload["contents"][0]["parts"]
+            if "inline_data" in part
+        ]
+        self.requests.append(images)
+        return FakeResponse(*self.responder(images))
+
+
+async def check_rooms(hass, session, names):
+    client = gemini_client.GeminiClient(hass, "key")
+    return await client.analyze_images(
+        session, [(name.encode(), name) for name in names]
+    )
+
+
+def test_rooms_checked_together_share_one_request():
+    async def run():
+        hass = FakeHass()
+        session = FakeSession()
+        results = await check_rooms(hass, session, ["kitchen", "den", "office"])
+        return session, results
+
+    session, results = asyncio.run(run())
+
+    assert session.requests == [["kitchen", "den", "office"]]
+    assert [result["comment"] for result in results] == ["kitchen", "den", "office"]
+
+
+def test_analyze_image_uses_single_room_format():
+    async def run():
+        hass = FakeHass()
+        session = FakeSession()
+        client = gemini_client.GeminiClient(hass, "key")
+        result = await client.analyze_image(
+            session=session, image_bytes=b"kitchen", prompt="kitchen"
+        )
+        return session, result
+
+    session, result = asyncio.run(run())
+
+    assert session.requests == [["kitchen"]]
+    assert result["comment"] == "kitchen"
+
+
+def test_batches_are_split_by_max_size():
+    names = [f"room{i}" for i in range(gemini_client.GEMINI_BATCH_MAX_SIZE + 2)]
+
+    async def run():
+        hass = FakeHass()
+        session = FakeSession()
+        results = await check_rooms(hass, session, names)
+        return session, results
+
+    session, results = asyncio.run(run())
+
+    assert [len(images) for images in session.requests] == [
+        gemini_client.GEMINI_BATCH_MAX_SIZE,
+        2,
+    ]
+    assert [result["comment"] for result in results] == names
+
+
+def test_batches_are_split_by_encoded_size(monkeypatch):
+    monkeypatch.setattr(gemini_client, "GEMINI_BATCH_MAX_BYTES", 10)
+
+    def check(size):
+        return gemini_client._Check("prompt", "x" * size)
+
+    checks = [check(4), check(4), check(4), check(25), check(1)]
+    batches = gemini_client._split_batches(checks)
+
+    # An oversized image is still sent, on its own
+    assert [[len(c.image_b64) for c in batch] for batch in batches] == [
+        [4, 4],
+        [4],
+        [25],
+        [1],
+    ]
+
+
+def test_missing_room_is_retried_on_its_own():
+    async def run():
+        hass = FakeHass()
+        session = FakeSession(lambda images: echo_rooms(images, skip={2}))
+        results = await check_rooms(hass, session, ["kitchen", "den", "office"])
+        return session, results
+
+    session, results = asyncio.run(run())
+
+    assert session.requests == [["kitchen", "den", "office"], ["den"]]
+    assert [result["comment"] for result in results] == ["kitchen", "den", "office"]
+
+
+def test_failed_retry_fails_only_its_own_check():
+    def responder(images):
+        if images == ["den"]:
+            return 200, b"not json"
+        return echo_rooms(images, skip={2})
+
+    async def run():
+        hass = FakeHass()
+        return await check_rooms(hass, FakeSession(responder), ["kitchen", "den", "office"])
+
+    kitchen, den, office = asyncio.run(run())
+
+    assert kitchen["comment"] == "kitchen"
+    assert isinstance(den, gemini_client.GeminiClientError)
+    assert office["comment"] == "office"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        (200, b"not json"),
+        (200, gemini_body("not json either")),
+        (200, gemini_body({"no_rooms": {}})),
+    ],
+)
+def test_malformed_batch_answer_falls_back_to_single_requests(response):
+    def responder(images):
+        return response if len(images) > 1 else echo_rooms(images)
+
+    async def run():
+        hass = FakeHass()
+        session = FakeSession(responder)
+        results = await check_rooms(hass, session, ["kitchen", "den"])
+        return session, results
+
+    session, results = asyncio.run(run())
+
+    assert session.requests == [["kitchen", "den"], ["kitchen"], ["den"]]
+    assert [result["comment"] for result in results] == ["kitchen", "den"]
+
+
+def test_http_error_fails_whole_batch_without_retry():
+    async def run():
+        hass = FakeHass()
+        session = FakeSession(lambda images: (500, b"internal error"))
+        results = await check_rooms(hass, session, ["kitchen", "den"])
+        return session, results
+
+    session, results = asyncio.run(run())
+
+    assert session.requests == [["kitchen", "den"]]
+    assert all(isinstance(result, gemini_client.GeminiClientError) for result in results)